@@ -1,5 +1,5 @@
 from app import create_app
-app = create_app()
 
 if __name__ == '__main__':
-    app.run()
\ No newline at end of file
+    # Built here rather than at import: spawned upload workers re-import this script
+    create_app().run()
@@ -12,20 +12,36 @@ def create_app():
         The created Flask application.
     """
     app = Flask(__name__)
-    CORS(app, origins=["http://localhost:5000", "http://localhost:5173"])  # Restricted origins for security (dev default)
+    app.config["CORS_ORIGINS"] = ["http://localhost:5000", "http://localhost:5173"]  # Restricted origins for security (dev default)
+    CORS(
+        app,
+        origins=app.config["CORS_ORIGINS"],
+        expose_headers=["X-Event-Cursor"],  # Resume cursor for the claim event stream
+    )
     app.config["SECRET_KEY"] = os.getenv("JWT_SECRET_KEY")
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    app.config["UPLOAD_FOLDER"] = "uploads"
-    # Ensure the upload folder exists
-    if not os.path.exists(app.config["UPLOAD_FOLDER"]):
-        os.makedirs(app.config["UPLOAD_FOLDER"])
+    # Bounded pools for CPU-heavy work (see executors.py)
+    app.config["BCRYPT_WORKERS"] = int(os.getenv("BCRYPT_WORKERS", os.cpu_count() or 1))
+    app.config["UPLOAD_WORKERS"] = int(os.getenv("UPLOAD_WORKERS", 2))
+    app.config["EXECUTOR_MAX_PENDING"] = int(os.getenv("EXECUTOR_MAX_PENDING", 16))
+    app.config["EXECUTOR_WAIT_SECONDS"] = float(os.getenv("EXECUTOR_WAIT_SECONDS", 5))
+    # Claim event streams (see routes.claim_events); each holds a thread in sync mode
+    app.config["EVENT_STREAM_MAX_CONNECTIONS"] = int(os.getenv("EVENT_STREAM_MAX_CONNECTIONS", 8))
+    # Threads running the (synchronous) routes when served with uvicorn
+    app.config["ASGI_WSGI_WORKERS"] = int(os.getenv("ASGI_WSGI_WORKERS", 16))
+    # Under uvicorn streams are served on the event loop, so it can hold far more
+    app.config["ASGI_EVENT_STREAM_MAX_CONNECTIONS"] = int(os.getenv("ASGI_EVENT_STREAM_MAX_CONNECTIONS", 1000))
+    app.config["EVENT_STREAM_MAX_SECONDS"] = int(os.getenv("EVENT_STREAM_MAX_SECONDS", 300))
     db.init_app(app)
     with app.app_context():
         from . import routes
         from . import models
-        # Creates all tables if they don't exist
-        db.create_all()
+        # Schema changes are an explicit step (`flask db_cli migrate`);
+        # AUTO_MIGRATE=true applies them at boot instead, e.g. for local dev
+        if os.getenv("AUTO_MIGRATE", "false").lower() == "true":
+            from .migrations import migrate
+            migrate()
         from .commands import db_cli
         app.register_blueprint(db_cli)
     return app
\ No newline at end of file
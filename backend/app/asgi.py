@@ -0,0 +1,93 @@
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+from a2wsgi import WSGIMiddleware
+from . import create_app
+from .auth_utils import decode_stream_ticket
+from .events import broker, render_events, ConnectionCap
+
+EVENTS_PATH = "/api/events/claims"
+
+
+def create_asgi_app():
+    """
+    Creates the ASGI application. Regular routes stay synchronous and run on
+    a fixed pool of ASGI_WSGI_WORKERS threads via a2wsgi; only the claim event
+    stream is served natively on the event loop, so open dashboards don't hold
+    any thread.
+    """
+    flask_app = create_app()
+    wsgi = WSGIMiddleware(flask_app, workers=flask_app.config["ASGI_WSGI_WORKERS"])
+    secret = flask_app.config["SECRET_KEY"]
+    origins = flask_app.config["CORS_ORIGINS"]
+    max_seconds = flask_app.config["EVENT_STREAM_MAX_SECONDS"]
+    slots = ConnectionCap(flask_app.config["ASGI_EVENT_STREAM_MAX_CONNECTIONS"])
+
+    async def respond(send, status, body, headers):
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode("utf-8")})
+
+    async def claim_events(scope, receive, send):
+        """Async twin of routes.claim_events; same ticket, cursor and limits."""
+        query = parse_qs(scope["query_string"].decode("latin-1"))
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        cors = []
+        if headers.get("origin") in origins:
+            cors = [(b"access-control-allow-origin", headers["origin"].encode()), (b"vary", b"Origin")]
+        json_headers = [(b"content-type", b"application/json")] + cors
+
+        subscriber = decode_stream_ticket(query.get("ticket", [None])[0], secret)
+        if not subscriber:
+            await respond(send, 401, {"message": "Stream ticket is missing or invalid!"}, json_headers)
+            return
+        if not slots.try_acquire():
+            await respond(send, 503, {"message": "Too many open event streams."}, json_headers + [(b"retry-after", b"5")])
+            return
+        try:
+            position = headers.get("last-event-id") or query.get("cursor", [None])[0] or broker.cursor
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/event-stream"),
+                        (b"cache-control", b"no-cache"),
+                        (b"x-accel-buffering", b"no"),
+                    ]
+                    + cors,
+                }
+            )
+
+            async def wait_disconnect():
+                while (await receive())["type"] != "http.disconnect":
+                    pass
+
+            disconnected = asyncio.ensure_future(wait_disconnect())
+            deadline = time.monotonic() + max_seconds
+            try:
+                while time.monotonic() < deadline and not disconnected.done():
+                    remaining = max(deadline - time.monotonic(), 0)
+                    read = asyncio.ensure_future(broker.read_async(position, timeout=min(15, remaining)))
+                    await asyncio.wait([read, disconnected], return_when=asyncio.FIRST_COMPLETED)
+                    if not read.done():
+                        read.cancel()
+                        break
+                    chunks, position = render_events(*read.result(), position, subscriber)
+                    for chunk in chunks:
+                        await send({"type": "http.response.body", "body": chunk.encode("utf-8"), "more_body": True})
+                await send({"type": "http.response.body", "body": b""})
+            except OSError:
+                pass  # Client went away mid-send
+            finally:
+                disconnected.cancel()
+        finally:
+            slots.release()
+
+    async def app(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == EVENTS_PATH and scope["method"] == "GET":
+            await claim_events(scope, receive, send)
+        else:
+            await wsgi(scope, receive, send)
+
+    return app
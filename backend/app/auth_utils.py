@@ -1,10 +1,63 @@
 from functools import wraps
 from flask import request, jsonify
 import jwt
+import bcrypt
+from datetime import datetime, timedelta
 from .models import User
+from .executors import bcrypt_executor
 from flask import current_app as app
 
 
+def hash_password(password):
+    """Hashes a password on the bounded bcrypt pool and returns it as text."""
+    hashed = bcrypt_executor().run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+    return hashed.decode("utf-8")
+
+
+def check_password(password, password_hash):
+    """Checks a password against its stored hash on the bounded bcrypt pool."""
+    return bcrypt_executor().run(
+        bcrypt.checkpw, password.encode("utf-8"), password_hash.encode("utf-8")
+    )
+
+
+STREAM_TICKET_SCOPE = "claim-events"
+STREAM_TICKET_TTL = timedelta(seconds=60)
+
+
+def issue_stream_ticket(user):
+    """
+    Issues a short-lived ticket for opening the claim event stream. EventSource
+    cannot send headers, so the ticket travels in the query string instead of
+    the long-lived login token; it carries no `user_id` and so is rejected by
+    token_required everywhere else.
+    """
+    return jwt.encode(
+        {
+            "sub": str(user.id),
+            "role": user.role,
+            "scope": STREAM_TICKET_SCOPE,
+            "exp": datetime.utcnow() + STREAM_TICKET_TTL,
+        },
+        app.config["SECRET_KEY"],
+        algorithm="HS256",
+    )
+
+
+def decode_stream_ticket(ticket, secret):
+    """
+    Returns {"user_id", "role"} for a valid stream ticket, else None. Needs no
+    app context or DB, so the async stream endpoint can call it too.
+    """
+    try:
+        data = jwt.decode(ticket or "", secret, algorithms=["HS256"])
+    except jwt.PyJWTError:
+        return None
+    if data.get("scope") != STREAM_TICKET_SCOPE:
+        return None
+    return {"user_id": data["sub"], "role": data["role"]}
+
+
 def token_required(f):
     """
     Decorator to check if a valid JWT token is in the request headers. If not, returns a 401 error.
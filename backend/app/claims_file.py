@@ -0,0 +1,69 @@
+import io
+
+REQUIRED_HEADERS = [
+    "claim_id", "patient_id", "patient_name", "status", "payer", "cpt_codes",
+    "icd10_codes", "priority", "amount", "dob", "dos", "submission_deadline"
+]
+
+
+class ClaimsFileError(Exception):
+    """An uploaded claims file that cannot be used, with optional per-column errors."""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message, errors)
+        self.message = message
+        self.errors = errors
+
+
+def parse_claims_file(data, filename):
+    """
+    Reads and type-checks an uploaded claims file (.xlsx or .csv).
+
+    Runs in the upload process pool, so it only takes and returns picklable
+    values and must not touch the database or the Flask app.
+    Returns the validated DataFrame or raises ClaimsFileError.
+    """
+    import pandas as pd  # Deferred so importing this module stays cheap
+
+    try:
+        df = (
+            pd.read_excel(io.BytesIO(data), sheet_name="Claims", engine='openpyxl')
+            if filename.endswith(".xlsx")
+            else pd.read_csv(io.BytesIO(data))
+        )
+    except Exception as e:
+        raise ClaimsFileError(f"Error reading file: {e}")
+    missing_headers = [h for h in REQUIRED_HEADERS if h not in df.columns]
+    if missing_headers:
+        raise ClaimsFileError(f"Missing headers: {', '.join(missing_headers)}")
+    df = df[REQUIRED_HEADERS]
+    validation_errors = []
+    col_types = {
+        "date": ["dob", "dos", "submission_deadline"],
+        "string": [
+            "claim_id",
+            "patient_id",
+            "patient_name",
+            "payer",
+            "cpt_codes",
+            "icd10_codes",
+        ],
+        "numeric": ["priority", "amount"],
+    }
+    for col_type, cols in col_types.items():
+        for col in cols:
+            df[col] = df[col].astype(str).str.strip()
+            if (df[col] == "").any():
+                validation_errors.append(f"Column '{col}' contains empty values.")
+                continue
+            if col_type == "date":
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+                if df[col].isnull().any():
+                    validation_errors.append(f"Column '{col}' has invalid date formats.")
+            elif col_type == "numeric":
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+                if df[col].isnull().any():
+                    validation_errors.append(f"Column '{col}' has non-numeric values.")
+    if validation_errors:
+        raise ClaimsFileError("File contains invalid data.", validation_errors)
+    return df
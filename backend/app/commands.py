@@ -1,13 +1,34 @@
 from flask import Blueprint
 import click
 from . import db
-from .models import User
+from .migrations import migrate as apply_migrations
+from .models import (
+    User,
+    Claim,
+    Note,
+    ClaimArchive,
+    NoteArchive,
+    CLOSED_CLAIM_STATUSES,
+    CLAIM_ID_LOCK_ID,
+)
+from sqlalchemy import select, delete, func, text
+from datetime import date, datetime, timedelta
 import bcrypt
 import os
 
 db_cli = Blueprint("db_cli", __name__)
 
 
+@db_cli.cli.command("migrate")
+def migrate():
+    """Applies pending schema migrations."""
+    applied = apply_migrations()
+    if applied:
+        print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+    else:
+        print("Schema is up to date.")
+
+
 @db_cli.cli.command("create-admin")
 def create_admin():
     """Creates the initial admin user."""
@@ -30,3 +51,90 @@ def create_admin():
     db.session.add(admin)
     db.session.commit()
     print(f'Admin user created. Username: "{username}", Password: "{password}"')
+
+
+def _month_start(day):
+    return day.replace(day=1)
+
+
+def _next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _ensure_archive_partition(month):
+    """Creates the monthly `claims_archive` partition holding `month` if missing."""
+    start = _month_start(month)
+    end = _next_month(start)
+    name = f"claims_archive_y{start.year}m{start.month:02d}"
+    db.session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF claims_archive "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    )
+    return name
+
+
+@db_cli.cli.command("create-archive-partitions")
+@click.option("--start", default=None, help="First month as YYYY-MM (default: current month).")
+@click.option("--months", default=12, type=int, help="Number of monthly partitions to create.")
+def create_archive_partitions(start, months):
+    """Pre-creates monthly range partitions of the claims archive."""
+    month = (
+        datetime.strptime(start, "%Y-%m").date() if start else _month_start(date.today())
+    )
+    for _ in range(months):
+        print(f"Partition ready: {_ensure_archive_partition(month)}")
+        month = _next_month(month)
+    db.session.commit()
+
+
+@db_cli.cli.command("archive-claims")
+@click.option("--older-than-days", default=90, type=int, help="Archive closed claims with a DOS older than this.")
+@click.option("--batch-size", default=1000, type=int, help="Claims moved per transaction.")
+def archive_claims(older_than_days, batch_size):
+    """Moves closed claims and their notes out of the hot tables into the archive."""
+    today = date.today()
+    cutoff = today - timedelta(days=older_than_days)
+    claim_cols = [c.name for c in Claim.__table__.columns]
+    note_cols = [c.name for c in Note.__table__.columns]
+    total = 0
+    while True:
+        db.session.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": CLAIM_ID_LOCK_ID})
+        # Skip rows a member is editing right now; they are picked up next run.
+        # Claims assigned today still count towards today's max_daily_claims.
+        ids = db.session.scalars(
+            select(Claim.id)
+            .where(
+                Claim.status.in_(CLOSED_CLAIM_STATUSES),
+                Claim.dos < cutoff,
+                Claim.assigned_at < today,
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not ids:
+            break
+        months = db.session.scalars(
+            select(func.date_trunc("month", Claim.dos)).where(Claim.id.in_(ids)).distinct()
+        ).all()
+        for month in months:
+            _ensure_archive_partition(month.date() if isinstance(month, datetime) else month)
+        db.session.execute(
+            ClaimArchive.__table__.insert().from_select(
+                claim_cols,
+                select(*[Claim.__table__.c[c] for c in claim_cols]).where(Claim.id.in_(ids)),
+            )
+        )
+        db.session.execute(
+            NoteArchive.__table__.insert().from_select(
+                note_cols,
+                select(*[Note.__table__.c[c] for c in note_cols]).where(Note.claim_id.in_(ids)),
+            )
+        )
+        db.session.execute(delete(Note).where(Note.claim_id.in_(ids)))
+        db.session.execute(delete(Claim).where(Claim.id.in_(ids)))
+        db.session.commit()
+        total += len(ids)
+        print(f"Archived {total} claims...")
+    print(f"Done. {total} claims with DOS before {cutoff} archived.")
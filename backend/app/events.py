@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import deque
+
+
+class ClaimEventBroker:
+    """
+    In-process publish/subscribe feed of claim changes for the dashboards.
+
+    Every event gets a cursor of the form "<epoch>:<sequence>". The last
+    `maxlen` events are kept so that clients can resume from the cursor they
+    last saw; a cursor that is too old or from a previous process yields a
+    reset, telling the client to re-fetch the full list once.
+
+    Subscribers wait either on a thread (read) or on an event loop
+    (read_async). This is a single-process stand-in: with several workers each
+    one has its own feed, so it should be swapped for Postgres LISTEN/NOTIFY
+    there.
+    """
+
+    def __init__(self, maxlen=1000):
+        self._epoch = uuid.uuid4().hex[:8]
+        self._sequence = 0
+        self._events = deque(maxlen=maxlen)
+        self._condition = threading.Condition()
+        self._async_waiters = set()
+
+    @property
+    def cursor(self):
+        """The cursor of the latest published event."""
+        with self._condition:
+            return self._format(self._sequence)
+
+    def _format(self, sequence):
+        return f"{self._epoch}:{sequence}"
+
+    def _parse(self, cursor):
+        """Returns the sequence number of a cursor, or None if it is unusable."""
+        epoch, _, sequence = (cursor or "").partition(":")
+        if epoch != self._epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+    def publish(self, event_type, claim, assigned_to_id, **data):
+        """Records an event and wakes up every waiting subscriber."""
+        with self._condition:
+            self._sequence += 1
+            self._events.append(
+                {
+                    "sequence": self._sequence,
+                    "cursor": self._format(self._sequence),
+                    "type": event_type,
+                    "assigned_to_id": str(assigned_to_id) if assigned_to_id else None,
+                    "claim": claim,
+                    **data,
+                }
+            )
+            self._condition.notify_all()
+            for loop, wakeup in self._async_waiters:
+                try:
+                    loop.call_soon_threadsafe(wakeup.set)
+                except RuntimeError:
+                    pass  # Loop already closed
+
+    def _collect(self, cursor):
+        """Returns (events, reset) after `cursor`, or None if nothing is new yet."""
+        sequence = self._parse(cursor)
+        if sequence is None or sequence > self._sequence:
+            return [], True
+        oldest = self._events[0]["sequence"] if self._events else self._sequence + 1
+        if sequence < oldest - 1:
+            return [], True  # Fell out of the replay buffer
+        if sequence == self._sequence:
+            return None
+        return [e for e in self._events if e["sequence"] > sequence], False
+
+    def read(self, cursor, timeout=None):
+        """
+        Returns (events, reset) for everything published after `cursor`,
+        blocking up to `timeout` seconds when there is nothing new yet.
+        """
+        with self._condition:
+            result = self._collect(cursor)
+            if result is None:
+                self._condition.wait(timeout)
+                result = self._collect(cursor)
+            return result or ([], False)
+
+    async def read_async(self, cursor, timeout=None):
+        """Like read(), but waits on the event loop instead of blocking a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            result = self._collect(cursor)
+            if result is not None:
+                return result
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+        with self._condition:
+            return self._collect(cursor) or ([], False)
+
+
+class ConnectionCap:
+    """Non-blocking counter limiting how many event streams are open at once."""
+
+    def __init__(self, limit):
+        self._limit = limit
+        self._open = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        with self._lock:
+            if self._open >= self._limit:
+                return False
+            self._open += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._open -= 1
+
+
+def render_events(events, reset, position, subscriber):
+    """
+    Formats a broker read as SSE messages for one subscriber (a decoded stream
+    ticket). Returns (chunks, new position); admins see every event, members
+    only those for claims assigned to them.
+    """
+    if reset:
+        position = broker.cursor
+        return [f"id: {position}\nevent: reset\ndata: {{}}\n\n"], position
+    if not events:
+        return [": keep-alive\n\n"], position
+    chunks = []
+    for event in events:
+        position = event["cursor"]
+        if subscriber["role"] == "Admin" or event["assigned_to_id"] == subscriber["user_id"]:
+            data = {k: v for k, v in event.items() if k != "sequence"}
+            chunks.append(f"id: {position}\nevent: {event['type']}\ndata: {json.dumps(data)}\n\n")
+    return chunks, position
+
+
+def claim_payload(claim, assignee_name):
+    """Serializes a claim in the shape used by the claim list endpoints."""
+    return {
+        "id": str(claim.id),
+        "claim_id": claim.claim_id,
+        "patient_name": claim.patient_name,
+        "payer": claim.payer,
+        "amount": str(claim.amount) if claim.amount else None,
+        "dos": claim.dos.strftime("%Y-%m-%d") if claim.dos else None,
+        "priority": claim.priority,
+        "status": claim.status,
+        "assignee": assignee_name or "Unassigned",
+    }
+
+
+broker = ClaimEventBroker()
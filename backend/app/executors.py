@@ -0,0 +1,99 @@
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, ProcessPoolExecutor
+from flask import current_app
+
+
+class ExecutorBusy(Exception):
+    """Raised when a bounded executor has no free slot within its wait time."""
+
+
+class BoundedExecutor:
+    """
+    Wraps an executor so that at most `max_workers + max_pending` tasks are
+    running or queued. Callers wait up to `wait` seconds for a slot and then
+    get ExecutorBusy, so a burst of expensive requests is shed instead of
+    piling up behind every other request.
+    """
+
+    def __init__(self, executor, max_workers, max_pending=0, wait=5, on_broken=None):
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._wait = wait
+        self._on_broken = on_broken
+
+    def submit(self, fn, *args):
+        if not self._slots.acquire(timeout=self._wait):
+            raise ExecutorBusy("Server is busy, please retry shortly.")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        """Runs `fn(*args)` on the executor and blocks for its result."""
+        try:
+            return self.submit(fn, *args).result()
+        except BrokenExecutor:
+            # A worker died (e.g. OOM); let the next call start a fresh pool
+            if self._on_broken:
+                self._on_broken(self)
+            raise
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executors = {}
+_lock = threading.Lock()
+
+
+def _get_executor(name, factory, workers_key):
+    with _lock:
+        if name not in _executors:
+            config = current_app.config
+            workers = config[workers_key]
+            _executors[name] = BoundedExecutor(
+                factory(workers),
+                workers,
+                max_pending=config["EXECUTOR_MAX_PENDING"],
+                wait=config["EXECUTOR_WAIT_SECONDS"],
+                on_broken=lambda executor: _discard_executor(name, executor),
+            )
+        return _executors[name]
+
+
+def _discard_executor(name, executor):
+    with _lock:
+        if _executors.get(name) is executor:
+            del _executors[name]
+    executor.shutdown()
+
+
+def bcrypt_executor():
+    """Thread pool for bcrypt, which releases the GIL while hashing."""
+    return _get_executor(
+        "bcrypt",
+        lambda workers: ThreadPoolExecutor(workers, thread_name_prefix="bcrypt"),
+        "BCRYPT_WORKERS",
+    )
+
+
+def upload_executor():
+    """
+    Process pool for pandas file parsing, which holds the GIL.
+
+    Uses spawn, not fork, because forking a threaded server can copy held
+    locks. Spawned workers re-import the entry script as `__mp_main__`, so an
+    entry script must not build the app at import time (see app.py).
+    """
+    return _get_executor(
+        "upload",
+        lambda workers: ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        ),
+        "UPLOAD_WORKERS",
+    )
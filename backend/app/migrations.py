@@ -0,0 +1,164 @@
+from sqlalchemy import text
+from . import db
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent migrators run one at a time
+MIGRATION_LOCK_ID = 7203114
+
+# Frozen DDL: never derived from the models, so a migration means the same
+# thing on every database no matter when it runs. IF NOT EXISTS lets
+# databases created by the old boot-time create_all() adopt the baseline.
+BASELINE = [
+    """
+    DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'user_roles') THEN
+            CREATE TYPE user_roles AS ENUM ('Member', 'Admin');
+        END IF;
+    END $$
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id UUID PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        username VARCHAR(80) NOT NULL UNIQUE,
+        password_hash VARCHAR(128) NOT NULL,
+        role user_roles NOT NULL,
+        max_daily_claims INTEGER NOT NULL,
+        seniority INTEGER NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        assign_by VARCHAR(50) NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        id UUID PRIMARY KEY,
+        name VARCHAR(100) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_skills (
+        user_id UUID NOT NULL REFERENCES users (id),
+        skill_id UUID NOT NULL REFERENCES skills (id),
+        PRIMARY KEY (user_id, skill_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rules (
+        id UUID PRIMARY KEY,
+        criteria_type VARCHAR(50) NOT NULL,
+        criteria_value VARCHAR(255),
+        strategy VARCHAR(50) NOT NULL,
+        priority INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS claims (
+        id UUID PRIMARY KEY,
+        claim_id VARCHAR(50) NOT NULL UNIQUE,
+        patient_id VARCHAR(50) NOT NULL,
+        patient_name VARCHAR(255),
+        cpt_codes VARCHAR(255),
+        icd10_codes VARCHAR(255),
+        dob DATE NOT NULL,
+        dos DATE NOT NULL,
+        submission_deadline DATE NOT NULL,
+        priority INTEGER NOT NULL,
+        amount INTEGER NOT NULL,
+        payer VARCHAR(255),
+        status VARCHAR(50) NOT NULL,
+        assigned_to_id UUID REFERENCES users (id),
+        assigned_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS notes (
+        id UUID PRIMARY KEY,
+        content TEXT NOT NULL,
+        timestamp TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        claim_id UUID NOT NULL REFERENCES claims (id),
+        user_id UUID NOT NULL REFERENCES users (id)
+    )
+    """,
+]
+
+CLAIMS_ARCHIVE = [
+    """
+    CREATE TABLE IF NOT EXISTS claims_archive (
+        id UUID NOT NULL,
+        dos DATE NOT NULL,
+        claim_id VARCHAR(50) NOT NULL,
+        patient_id VARCHAR(50) NOT NULL,
+        patient_name VARCHAR(255),
+        cpt_codes VARCHAR(255),
+        icd10_codes VARCHAR(255),
+        dob DATE NOT NULL,
+        submission_deadline DATE NOT NULL,
+        priority INTEGER NOT NULL,
+        amount INTEGER NOT NULL,
+        payer VARCHAR(255),
+        status VARCHAR(50) NOT NULL,
+        assigned_to_id UUID,
+        assigned_at TIMESTAMP WITHOUT TIME ZONE,
+        archived_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        PRIMARY KEY (id, dos)
+    ) PARTITION BY RANGE (dos)
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_claims_archive_claim_id ON claims_archive (claim_id)",
+    """
+    CREATE TABLE IF NOT EXISTS notes_archive (
+        id UUID PRIMARY KEY,
+        content TEXT NOT NULL,
+        timestamp TIMESTAMP WITHOUT TIME ZONE,
+        claim_id UUID NOT NULL,
+        user_id UUID NOT NULL,
+        archived_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_notes_archive_claim_id ON notes_archive (claim_id)",
+]
+
+# Append-only: never edit an applied migration, add a new version instead.
+MIGRATIONS = [
+    (1, "Baseline schema", BASELINE),
+    (2, "Partitioned claims archive", CLAIMS_ARCHIVE),
+]
+
+
+def migrate():
+    """
+    Applies pending schema migrations in order and returns the versions applied.
+    Each migration runs in one transaction, under the advisory lock, together
+    with its `schema_migrations` row.
+    """
+    applied = []
+    for version, description, statements in MIGRATIONS:
+        # Lock first: even creating schema_migrations races between workers
+        db.session.execute(
+            text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID}
+        )
+        db.session.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version INTEGER PRIMARY KEY, "
+                "description VARCHAR(255) NOT NULL, "
+                "applied_at TIMESTAMP NOT NULL DEFAULT now())"
+            )
+        )
+        done = db.session.execute(
+            text("SELECT 1 FROM schema_migrations WHERE version = :version"),
+            {"version": version},
+        ).first()
+        if done:
+            db.session.commit()
+            continue
+        for statement in statements:
+            db.session.execute(text(statement))
+        db.session.execute(
+            text(
+                "INSERT INTO schema_migrations (version, description) "
+                "VALUES (:version, :description)"
+            ),
+            {"version": version, "description": description},
+        )
+        db.session.commit()
+        applied.append(version)
+    return applied
@@ -3,6 +3,12 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import Enum as SQLEnum  # For role enum
 import uuid
 
+# Statuses after which a claim is no longer worked and may be archived
+CLOSED_CLAIM_STATUSES = ("Submitted",)
+# pg_advisory_xact_lock key held while creating or archiving claims, so a
+# claim_id stays unique across claims and claims_archive
+CLAIM_ID_LOCK_ID = 7203115
+
 user_skills = db.Table(
     "user_skills",
     db.Column(
@@ -84,3 +90,43 @@ class Note(db.Model):
     timestamp = db.Column(db.DateTime, server_default=db.func.now())
     claim_id = db.Column(UUID(as_uuid=True), db.ForeignKey("claims.id"), nullable=False)
     user_id = db.Column(UUID(as_uuid=True), db.ForeignKey("users.id"), nullable=False)
+
+
+class ClaimArchive(db.Model):
+    """Cold storage for closed claims, range-partitioned by month of `dos`.
+
+    Monthly partitions are created by the `create-archive-partitions` and
+    `archive-claims` commands. Postgres requires the partition key in the
+    primary key, so `claim_id` is indexed rather than unique here.
+    """
+
+    __tablename__ = "claims_archive"
+    id = db.Column(UUID(as_uuid=True), primary_key=True)
+    dos = db.Column(db.Date, primary_key=True)
+    claim_id = db.Column(db.String(50), nullable=False, index=True)
+    patient_id = db.Column(db.String(50), nullable=False)
+    patient_name = db.Column(db.String(255))
+    cpt_codes = db.Column(db.String(255))
+    icd10_codes = db.Column(db.String(255))
+    dob = db.Column(db.Date, nullable=False)
+    submission_deadline = db.Column(db.Date, nullable=False)
+    priority = db.Column(db.Integer, nullable=False)
+    amount = db.Column(db.Integer, nullable=False)
+    payer = db.Column(db.String(255))
+    status = db.Column(db.String(50), nullable=False)
+    assigned_to_id = db.Column(UUID(as_uuid=True), nullable=True)
+    assigned_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, server_default=db.func.now())
+    __table_args__ = {"postgresql_partition_by": "RANGE (dos)"}
+
+
+class NoteArchive(db.Model):
+    """Notes belonging to archived claims, moved alongside their claim."""
+
+    __tablename__ = "notes_archive"
+    id = db.Column(UUID(as_uuid=True), primary_key=True)
+    content = db.Column(db.Text, nullable=False)
+    timestamp = db.Column(db.DateTime)
+    claim_id = db.Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = db.Column(UUID(as_uuid=True), nullable=False)
+    archived_at = db.Column(db.DateTime, server_default=db.func.now())
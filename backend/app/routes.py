@@ -1,14 +1,38 @@
-from flask import jsonify, request, current_app as app
+from flask import jsonify, request, Response, current_app as app
 from . import db
-from .models import User, Claim, Skill, Note, Rule
-from .auth_utils import token_required, admin_required
-from sqlalchemy import func, desc, asc
-import bcrypt
+from .models import User, Claim, ClaimArchive, Skill, Note, Rule, CLAIM_ID_LOCK_ID
+from .auth_utils import (
+    token_required,
+    admin_required,
+    hash_password,
+    check_password,
+    issue_stream_ticket,
+    decode_stream_ticket,
+)
+from .events import broker, claim_payload, render_events, ConnectionCap
+from .executors import ExecutorBusy, upload_executor
+from concurrent.futures import BrokenExecutor
+from .claims_file import ClaimsFileError, parse_claims_file
+from sqlalchemy import func, desc, asc, select, union, text
 import jwt
+import time
 from datetime import datetime, timedelta, date
-import pandas as pd
-import os
-from dateutil import parser  # For flexible date parsing if needed
+from decimal import Decimal, ROUND_HALF_UP
+
+
+stream_slots = ConnectionCap(app.config["EVENT_STREAM_MAX_CONNECTIONS"])
+
+
+@app.errorhandler(ExecutorBusy)
+def executor_busy(e):
+    """Sheds load when the bcrypt or upload workers are saturated."""
+    return jsonify({"message": str(e)}), 503, {"Retry-After": "1"}
+
+
+@app.errorhandler(BrokenExecutor)
+def executor_broken(e):
+    """A pool worker crashed, e.g. out of memory on a very large upload."""
+    return jsonify({"message": "Processing failed, the file may be too large."}), 500
 
 
 # --- Authentication ---
@@ -37,11 +61,10 @@ def register():
         return jsonify({"message": "Username already exists"}), 409
     if len(data.get("password", "")) < 8:  # Basic validation
         return jsonify({"message": "Password must be at least 8 characters"}), 400
-    hashed_password = bcrypt.hashpw(data["password"].encode("utf-8"), bcrypt.gensalt())
     new_user = User(
         name=data["name"],
         username=data["username"],
-        password_hash=hashed_password.decode("utf-8"),
+        password_hash=hash_password(data["password"]),
     )
     db.session.add(new_user)
     db.session.commit()
@@ -71,9 +94,7 @@ def login():
     data = request.get_json()
     user = User.query.filter_by(username=data["username"]).first()
     print(user)
-    if user and bcrypt.checkpw(
-        data["password"].encode("utf-8"), user.password_hash.encode("utf-8")
-    ):
+    if user and check_password(data["password"], user.password_hash):
         if not user.is_active:
             return jsonify({"message": "Account is not active."}), 403
         token = jwt.encode(
@@ -215,8 +236,9 @@ def get_all_claims(current_user):
     """
     ... (unchanged, but assignee check uses simplified roles)
     """
+    cursor = broker.cursor  # Taken before the query so no change is missed
     claims = Claim.query.order_by(Claim.claim_id.desc()).all()
-    return jsonify(
+    response = jsonify(
         [
             {
                 "id": str(c.id),
@@ -231,12 +253,15 @@ def get_all_claims(current_user):
             for c in claims
         ]
     )
+    response.headers["X-Event-Cursor"] = cursor
+    return response
 
 
 @app.route("/api/admin/stats", methods=["GET"])  # New: Statistics
 @admin_required
 def get_stats(current_user):
     """Returns aggregates: total claims, unassigned, by status, avg workload."""
+    cursor = broker.cursor
     total_claims = db.session.query(func.count(Claim.id)).scalar()
     unassigned = (
         db.session.query(func.count(Claim.id))
@@ -262,7 +287,7 @@ def get_stats(current_user):
         if daily_workload
         else 0
     )
-    return jsonify(
+    response = jsonify(
         {
             "total_claims": total_claims,
             "unassigned": unassigned,
@@ -270,6 +295,8 @@ def get_stats(current_user):
             "avg_daily_workload": round(avg_workload, 2),
         }
     )
+    response.headers["X-Event-Cursor"] = cursor
+    return response
 
 
 @app.route("/api/admin/claims/upload-validate", methods=["POST"])
@@ -278,58 +305,24 @@ def validate_claims_upload(current_user):
     """
     Validate a claims file... (docstring unchanged)
     """
+    import pandas as pd  # Imported here, not at module level, so app startup skips pandas
+
     if "file" not in request.files:
         return jsonify({"message": "No file part"}), 400
     file = request.files["file"]
+    # Parsing runs in the upload process pool so it doesn't hold this worker's GIL
     try:
-        df = (
-            pd.read_excel(file, sheet_name="Claims", engine='openpyxl')
-            if file.filename.endswith(".xlsx")
-            else pd.read_csv(file)
-        )
-    except Exception as e:
-        return jsonify({"message": f"Error reading file: {e}"}), 400
-    required_headers = [
-        "claim_id", "patient_id", "patient_name", "status", "payer", "cpt_codes",
-        "icd10_codes", "priority", "amount", "dob", "dos", "submission_deadline"
-    ]
-    missing_headers = [h for h in required_headers if h not in df.columns]
-    if missing_headers:
-        return jsonify({"message": f"Missing headers: {', '.join(missing_headers)}"}), 400
-    df = df[required_headers]
-    # Full validation loop (ensure this is copied if placeholder was used)
-    validation_errors = []
-    col_types = {
-        "date": ["dob", "dos", "submission_deadline"],
-        "string": [
-            "claim_id",
-            "patient_id",
-            "patient_name",
-            "payer",
-            "cpt_codes",
-            "icd10_codes",
-        ],
-        "numeric": ["priority", "amount"],
-    }
-    for col_type, cols in col_types.items():
-        for col in cols:
-            df[col] = df[col].astype(str).str.strip()
-            if (df[col] == "").any():
-                validation_errors.append(f"Column '{col}' contains empty values.")
-                continue
-            if col_type == "date":
-                df[col] = pd.to_datetime(df[col], errors="coerce")
-                if df[col].isnull().any():
-                    validation_errors.append(f"Column '{col}' has invalid date formats.")
-            elif col_type == "numeric":
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-                if df[col].isnull().any():
-                    validation_errors.append(f"Column '{col}' has non-numeric values.")
-    if validation_errors:
-        return jsonify({"message": "File contains invalid data.", "errors": validation_errors}), 400
+        df = upload_executor().run(parse_claims_file, file.read(), file.filename)
+    except ClaimsFileError as e:
+        if e.errors:
+            return jsonify({"message": e.message, "errors": e.errors}), 400
+        return jsonify({"message": e.message}), 400
     # Check for duplicate claim_id
     if df["claim_id"].duplicated().any():
         return jsonify({"message": "Duplicate claim_ids found"}), 400
+    existing = existing_claim_ids(df["claim_id"].tolist())
+    if existing:
+        return jsonify({"message": f"Claim IDs already exist: {', '.join(existing)}"}), 400
     # --- SETUP ---
     # Apply rules: Tag claims with strategy instead of filtering out
     rules = Rule.query.order_by(Rule.priority).all()
@@ -419,6 +412,22 @@ def validate_claims_upload(current_user):
     return jsonify({"assignable_claims": assignable, "unassignable_claims": unassignable})
 
 
+def to_int(value):
+    """Rounds an uploaded number the way Postgres casts it into an Integer column."""
+    return int(Decimal(str(value)).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def existing_claim_ids(claim_ids):
+    """Returns which of `claim_ids` are already taken, by live or archived claims."""
+    if not claim_ids:
+        return []
+    query = union(
+        select(Claim.claim_id).where(Claim.claim_id.in_(claim_ids)),
+        select(ClaimArchive.claim_id).where(ClaimArchive.claim_id.in_(claim_ids)),
+    )
+    return sorted(db.session.scalars(query).all())
+
+
 def assign_claim_to_group(claim_row, user_group, workload):
     """Updated: For seniority, pick highest eligible first; general skill/capacity check."""
     payer = claim_row["payer"]
@@ -449,7 +458,14 @@ def execute_claims_upload(current_user):
     claims_to_create = data.get("assignable_claims")
     if not claims_to_create:
         return jsonify({"message": "No claims provided"}), 400
+    created = []
     try:
+        # Serializes with archive-claims so an ID can't slip between the two tables
+        db.session.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": CLAIM_ID_LOCK_ID})
+        existing = existing_claim_ids([c["claim_id"] for c in claims_to_create])
+        if existing:
+            db.session.rollback()
+            return jsonify({"message": f"Claim IDs already exist: {', '.join(existing)}"}), 409
         for claim_data in claims_to_create:
             assignee = User.query.filter_by(name=claim_data["assign_to"]).first()
             if not assignee:
@@ -470,18 +486,28 @@ def execute_claims_upload(current_user):
                 dob=dob,
                 dos=dos,
                 submission_deadline=deadline,
-                priority=claim_data["priority"],
-                amount=claim_data["amount"],
+                priority=to_int(claim_data["priority"]),
+                amount=to_int(claim_data["amount"]),
                 payer=claim_data["payer"],
                 status="NEW",  # Initial state
                 assigned_to_id=assignee.id,
                 # assigned_at auto-set by model default
             )
             db.session.add(new_claim)
+            created.append((new_claim, assignee))
+        db.session.flush()
+        # Serialize before commit so reading them back doesn't reload every row;
+        # numbers were coerced above, so this matches what the list endpoints return
+        events = [
+            (claim_payload(claim, assignee.name), assignee.id)
+            for claim, assignee in created
+        ]
         db.session.commit()
     except Exception as e:
         db.session.rollback()
         return jsonify({"message": f"Error: {str(e)}"}), 500
+    for payload, assigned_to_id in events:
+        broker.publish("claim.created", payload, assigned_to_id)
     return jsonify({"message": f"Created {len(claims_to_create)} claims."}), 201
 
 
@@ -492,6 +518,7 @@ def get_member_claims(current_user):
     """
     ... (updated: sort by priority/deadline; include priority)
     """
+    cursor = broker.cursor
     claims = (
         Claim.query.filter_by(assigned_to_id=current_user.id)
         .order_by(
@@ -499,7 +526,7 @@ def get_member_claims(current_user):
         )  # Better sorting
         .all()
     )
-    return jsonify(
+    response = jsonify(
         [
             {
                 "id": str(c.id),
@@ -511,13 +538,19 @@ def get_member_claims(current_user):
                 "priority": c.priority,  # Added
                 "status": c.status,
                 "notes": [
-                    {"content": note.content, "timestamp": note.timestamp.isoformat()}
+                    {
+                        "id": str(note.id),
+                        "content": note.content,
+                        "timestamp": note.timestamp.isoformat(),
+                    }
                     for note in c.notes
                 ],
             }
             for c in claims
         ]
     )
+    response.headers["X-Event-Cursor"] = cursor
+    return response
 
 
 @app.route("/api/member/claims/<uuid:claim_id>", methods=["PUT"])
@@ -533,13 +566,89 @@ def update_member_claim(current_user, claim_id):
     valid_statuses = ["NEW", "In Progress", "Submitted", "On Hold"]  # Enum-like
     if "status" in data and data["status"] not in valid_statuses:
         return jsonify({"message": "Invalid status"}), 400
+    previous_status = claim.status
     if "status" in data:
         claim.status = data["status"]
     # Always append new note (immutable audit)
+    new_note = None
     if "note" in data:
         new_note = Note(
             content=data["note"], claim_id=claim.id, user_id=current_user.id
         )
         db.session.add(new_note)
+    payload = claim_payload(claim, current_user.name)
     db.session.commit()
-    return jsonify({"message": "Claim updated."})
+    note = None
+    if new_note:
+        note = {
+            "id": str(new_note.id),
+            "content": new_note.content,
+            "timestamp": new_note.timestamp.isoformat(),
+        }
+    if claim.status != previous_status:
+        broker.publish(
+            "claim.status_changed",
+            payload,
+            current_user.id,
+            previous_status=previous_status,
+        )
+    if new_note:
+        broker.publish(
+            "claim.note_added",
+            payload,
+            current_user.id,
+            note=note,
+        )
+    # Returned so the client can update itself without waiting for the feed
+    return jsonify({"message": "Claim updated.", "claim": payload, "note": note})
+
+
+@app.route("/api/events/ticket", methods=["POST"])
+@token_required
+def claim_events_ticket(current_user):
+    """Returns a short-lived ticket for opening /api/events/claims."""
+    return jsonify({"ticket": issue_stream_ticket(current_user)})
+
+
+@app.route("/api/events/claims", methods=["GET"])
+def claim_events():
+    """
+    Server-sent events feed of claim changes (created, status changed, note added).
+
+    Authenticated by `?ticket=` from /api/events/ticket. Clients pass the
+    `X-Event-Cursor` header of their last full-list response as `?cursor=`; on
+    reconnect the browser's `Last-Event-ID` takes precedence. A `reset` event
+    means the cursor can no longer be resumed and the list must be re-fetched.
+
+    Each open stream holds a request thread here, so at most
+    EVENT_STREAM_MAX_CONNECTIONS are served and each is closed after
+    EVENT_STREAM_MAX_SECONDS (clients resume from their cursor). Under uvicorn
+    this path is served without threads instead (see asgi.py).
+    """
+    subscriber = decode_stream_ticket(request.args.get("ticket"), app.config["SECRET_KEY"])
+    if not subscriber:
+        return jsonify({"message": "Stream ticket is missing or invalid!"}), 401
+    if not stream_slots.try_acquire():
+        return jsonify({"message": "Too many open event streams."}), 503, {"Retry-After": "5"}
+    cursor = request.headers.get("Last-Event-ID") or request.args.get("cursor")
+    cursor = cursor or broker.cursor
+    max_seconds = app.config["EVENT_STREAM_MAX_SECONDS"]
+
+    # Runs after the request context is gone, so it must not touch the DB
+    def stream():
+        yield ": connected\n\n"  # Flushes the headers before the first wait
+        position = cursor
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            remaining = deadline - time.monotonic()
+            events, reset = broker.read(position, timeout=min(15, max(remaining, 0)))
+            chunks, position = render_events(events, reset, position, subscriber)
+            yield from chunks
+
+    response = Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    response.call_on_close(stream_slots.release)
+    return response
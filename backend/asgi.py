@@ -0,0 +1,8 @@
+from app.asgi import create_asgi_app
+
+# Serving with uvicorn: uvicorn asgi:app  (one worker process; see README)
+# Routes stay synchronous and run on a pool of ASGI_WSGI_WORKERS threads, while
+# bcrypt and upload parsing are bounded by BCRYPT_WORKERS / UPLOAD_WORKERS.
+# The claim event stream runs on the event loop without holding a thread.
+# The event broker is per process, so more workers would split the feed.
+app = create_asgi_app()
@@ -0,0 +1,89 @@
+"""
+Concurrency benchmark: dashboard reads under a burst of logins.
+
+Start the server in one of the two modes, then run this script against it:
+
+    flask run --port 5000                              # sync (threaded WSGI)
+    uvicorn asgi:app --port 5000                       # uvicorn (bounded offload)
+
+    python benchmarks/concurrency.py --username admin --password secret
+
+Logins are bcrypt-bound; the interesting number is the latency of the cheap
+dashboard reads (`/api/admin/stats`) while those logins are in flight.
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def request(url, data=None, token=None):
+    """Performs one request and returns (seconds, status code, body)."""
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as resp:
+            payload = resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        payload = e.read()
+        status = e.code
+    return time.perf_counter() - start, status, payload
+
+
+def summarize(name, results, wall):
+    latencies = sorted(t for t, _, _ in results)
+    errors = sum(1 for _, status, _ in results if status >= 400)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    print(
+        f"{name:>6}: n={len(latencies)} errors={errors} "
+        f"p50={statistics.median(latencies) * 1000:.0f}ms "
+        f"p95={p95 * 1000:.0f}ms max={latencies[-1] * 1000:.0f}ms "
+        f"throughput={len(latencies) / wall:.1f}/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:5000/api")
+    parser.add_argument("--username", required=True, help="An active Admin user.")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    credentials = {"username": args.username, "password": args.password}
+    _, status, payload = request(f"{args.url}/login", credentials)
+    if status != 200:
+        raise SystemExit(f"Login failed with status {status}")
+    token = json.loads(payload)["token"]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        logins, reads = [], []
+        # Interleave so reads compete with logins rather than queueing after them
+        for i in range(max(args.logins, args.reads)):
+            if i < args.logins:
+                logins.append(pool.submit(request, f"{args.url}/login", credentials))
+            if i < args.reads:
+                reads.append(
+                    pool.submit(request, f"{args.url}/admin/stats", None, token)
+                )
+        login_results = [f.result() for f in logins]
+        read_results = [f.result() for f in reads]
+    wall = time.perf_counter() - start
+
+    summarize("login", login_results, wall)
+    summarize("stats", read_results, wall)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Startup benchmark: import time and cold start to first request.
+
+Each run starts a fresh interpreter that imports the app, calls create_app()
+and serves one request through the test client, then reports:
+
+    import      time to `from app import create_app`
+    create_app  time spent in create_app()
+    first_req   time for the first request (no token, so no DB round trip)
+    total       process spawn to first response, including the interpreter
+    pandas      whether pandas got imported along the way
+
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --importtime   # slowest modules, via -X importtime
+
+Run from the backend/ directory with the usual .env in place.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from app import create_app
+t1 = time.perf_counter()
+app = create_app()
+t2 = time.perf_counter()
+app.test_client().get("/api/member/claims")
+t3 = time.perf_counter()
+print(json.dumps({
+    "import": t1 - t0,
+    "create_app": t2 - t1,
+    "first_req": t3 - t2,
+    "pandas": "pandas" in sys.modules,
+}))
+"""
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_probe():
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["total"] = time.perf_counter() - start
+    return result
+
+
+def show_importtime(top):
+    """Prints the modules with the highest cumulative import time."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from app import create_app"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    for cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:8.1f}ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.importtime:
+        show_importtime(args.top)
+        return
+    results = [run_probe() for _ in range(args.runs)]
+    for key in ("import", "create_app", "first_req", "total"):
+        values = [r[key] for r in results]
+        print(
+            f"{key:>10}: median={statistics.median(values) * 1000:.0f}ms "
+            f"min={min(values) * 1000:.0f}ms max={max(values) * 1000:.0f}ms"
+        )
+    print(f"{'pandas':>10}: {'loaded' if any(r['pandas'] for r in results) else 'not loaded'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import api from './axiosConfig';
+
+const CLAIM_EVENT_TYPES = [
+    'claim.created',
+    'claim.status_changed',
+    'claim.note_added',
+];
+const RECONNECT_BASE_DELAY_MS = 3000;
+const RECONNECT_MAX_DELAY_MS = 60000;
+const MAX_RECONNECT_ATTEMPTS = 6;
+
+// Subscribes to the server-sent claim change feed, starting after `cursor`
+// (the X-Event-Cursor header of the list response). Every (re)connect fetches a
+// fresh short-lived stream ticket and resumes from the last event seen, so the
+// long-lived login token never goes into a URL. Failed connects are retried
+// with exponential backoff (or after the server's Retry-After). `onReset` means
+// the list must be re-fetched; `onError` means the feed gave up, either because
+// the session expired or after MAX_RECONNECT_ATTEMPTS failures in a row.
+// Returns an unsubscribe function.
+export const subscribeToClaimEvents = (cursor, onEvent, onReset, onError) => {
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+    let attempts = 0;
+    let lastCursor = cursor;
+
+    const retry = (err, retryAfterSeconds) => {
+        if (closed) return;
+        attempts += 1;
+        if (attempts > MAX_RECONNECT_ATTEMPTS) {
+            onError(err);
+            return;
+        }
+        const backoff = Math.min(
+            RECONNECT_BASE_DELAY_MS * 2 ** (attempts - 1),
+            RECONNECT_MAX_DELAY_MS
+        );
+        // Jitter keeps dashboards from reconnecting in lockstep after a restart
+        const delay = Math.max(backoff * (0.5 + Math.random() / 2), (retryAfterSeconds || 0) * 1000);
+        retryTimer = setTimeout(connect, delay);
+    };
+
+    const connect = async () => {
+        let ticket;
+        try {
+            const response = await api.post('/events/ticket');
+            ticket = response.data.ticket;
+        } catch (err) {
+            const status = err.response?.status;
+            if (status === 401 || status === 403) {
+                if (!closed) onError(err);
+                return;
+            }
+            retry(err, Number(err.response?.headers?.['retry-after']));
+            return;
+        }
+        if (closed) return;
+        const params = new URLSearchParams({ ticket });
+        if (lastCursor) {
+            params.set('cursor', lastCursor);
+        }
+        source = new EventSource(
+            `${import.meta.env.VITE_API_BASE_URL}/events/claims?${params}`
+        );
+        source.onopen = () => {
+            attempts = 0;
+        };
+        CLAIM_EVENT_TYPES.forEach((type) =>
+            source.addEventListener(type, (e) => {
+                lastCursor = e.lastEventId;
+                onEvent(type, JSON.parse(e.data));
+            })
+        );
+        source.addEventListener('reset', (e) => {
+            lastCursor = e.lastEventId;
+            onReset();
+        });
+        // The browser's own retry would reuse the expired ticket, so reconnect ourselves.
+        // This also fires when a stream hits its time limit, which is not a failure
+        // as long as it had opened (attempts was reset then).
+        source.onerror = (err) => {
+            source.close();
+            retry(err);
+        };
+    };
+
+    connect();
+    return () => {
+        closed = true;
+        clearTimeout(retryTimer);
+        if (source) source.close();
+    };
+};
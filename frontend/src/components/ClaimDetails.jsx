@@ -1,12 +1,16 @@
 import React, { useState, useEffect } from 'react';
 import api from '../api/axiosConfig';
+import { subscribeToClaimEvents } from '../api/claimEvents';
 
 const ClaimDetails = () => {
     const [claims, setClaims] = useState([]);
     const [isLoading, setIsLoading] = useState(true);
     const [error, setError] = useState('');
+    const [feedError, setFeedError] = useState('');
 
     useEffect(() => {
+        let unsubscribe = () => {};
+        let cancelled = false;
         const fetchClaims = async () => {
             try {
                 setIsLoading(true);
@@ -14,6 +18,7 @@ const ClaimDetails = () => {
                 const response = await api.get('/admin/claims');
                 setClaims(response.data);
                 setError('');
+                return response.headers['x-event-cursor'];
             } catch (err) {
                 setError('Failed to fetch claim details.');
                 console.error(err);
@@ -21,7 +26,29 @@ const ClaimDetails = () => {
                 setIsLoading(false);
             }
         };
-        fetchClaims();
+        const handleClaimEvent = (type, event) => {
+            setClaims(prev => {
+                if (type === 'claim.created') {
+                    return prev.some(c => c.id === event.claim.id) ? prev : [event.claim, ...prev];
+                }
+                return prev.map(c => (c.id === event.claim.id ? { ...c, status: event.claim.status } : c));
+            });
+        };
+        // Full fetch once, then follow deltas; re-fetch only when the feed resets
+        const load = async () => {
+            unsubscribe();
+            const cursor = await fetchClaims();
+            if (cancelled) return; // Unmounted while fetching
+            setFeedError('');
+            unsubscribe = subscribeToClaimEvents(cursor, handleClaimEvent, load, () =>
+                setFeedError('Live updates stopped. Please refresh or log in again.')
+            );
+        };
+        load();
+        return () => {
+            cancelled = true;
+            unsubscribe();
+        };
     }, []);
 
     if (isLoading) {
@@ -35,6 +62,7 @@ const ClaimDetails = () => {
     return (
         <div>
             <h3>All Claims in Database</h3>
+            {feedError && <p className="error">{feedError}</p>}
             <table>
                 <thead>
                     <tr>
@@ -1,11 +1,13 @@
 import React, { useState, useEffect } from "react";
 import api from "../api/axiosConfig";
+import { subscribeToClaimEvents } from "../api/claimEvents";
 
 const MemberDashboard = () => {
 	const [claims, setClaims] = useState([]);
 	const [editedClaims, setEditedClaims] = useState([]);
 	const [isModalOpen, setIsModalOpen] = useState(false);
 	const [changesToConfirm, setChangesToConfirm] = useState(null);
+	const [feedError, setFeedError] = useState("");
 
 	const fetchMyClaims = async () => {
 		try {
@@ -20,13 +22,53 @@ const MemberDashboard = () => {
 					return { ...c, noteContent: latestNote };
 				})
 			);
+			return response.headers["x-event-cursor"];
 		} catch (error) {
 			console.error("Could not fetch claims.", error);
 		}
 	};
 
+	// Applies one change from the event feed (or a save response) to a claims list
+	const applyClaimEvent = (list, type, event) => {
+		if (type === "claim.created") {
+			if (list.some((c) => c.id === event.claim.id)) return list;
+			return [...list, { ...event.claim, notes: [], noteContent: "" }];
+		}
+		return list.map((c) => {
+			if (c.id !== event.claim.id) return c;
+			if (type === "claim.status_changed") {
+				return { ...c, status: event.claim.status };
+			}
+			// Our own saves arrive twice: from the PUT response and from the feed
+			if (c.notes?.some((n) => n.id === event.note.id)) return c;
+			const notes = [...(c.notes || []), event.note];
+			return { ...c, notes, noteContent: event.note.content };
+		});
+	};
+
+	const handleClaimEvent = (type, event) => {
+		setClaims((prev) => applyClaimEvent(prev, type, event));
+		setEditedClaims((prev) => applyClaimEvent(prev, type, event));
+	};
+
 	useEffect(() => {
-		fetchMyClaims();
+		let unsubscribe = () => {};
+		let cancelled = false;
+		// Full fetch once, then follow deltas; re-fetch only when the feed resets
+		const load = async () => {
+			unsubscribe();
+			const cursor = await fetchMyClaims();
+			if (cancelled) return; // Unmounted while fetching
+			setFeedError("");
+			unsubscribe = subscribeToClaimEvents(cursor, handleClaimEvent, load, () =>
+				setFeedError("Live updates stopped. Please refresh or log in again.")
+			);
+		};
+		load();
+		return () => {
+			cancelled = true;
+			unsubscribe();
+		};
 	}, []);
 
 	const handleInputChange = (claimId, field, value) => {
@@ -69,11 +111,14 @@ const MemberDashboard = () => {
 		if (note || note === "") payload.note = note; // Allow sending empty note to clear it
 
 		// Members can update status and add notes
-		await api.put(`/member/claims/${claimId}`, payload);
+		const response = await api.put(`/member/claims/${claimId}`, payload);
 
+		// Apply the saved state right away rather than waiting for the feed
+		const { claim, note: savedNote } = response.data;
+		handleClaimEvent("claim.status_changed", { claim });
+		if (savedNote) handleClaimEvent("claim.note_added", { claim, note: savedNote });
 		setIsModalOpen(false);
 		setChangesToConfirm(null);
-		fetchMyClaims();
 	};
 
 	const handleCancel = () => {
@@ -91,6 +136,7 @@ const MemberDashboard = () => {
 	return (
 		<div>
 			<h2>My Assigned Claims</h2>
+			{feedError && <p className="error">{feedError}</p>}
 			<table>
 				<thead>
 					<tr>